@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, List
+
+from .core import generate_by_skill
+
+
+def generate_batch(
+    skill_id: str,
+    n: int,
+    difficulty: int,
+    rng: random.Random | None = None,
+    section: str = "Section I",
+    marks: int = 1,
+) -> List[Dict[str, Any]]:
+    """
+    Generate n questions for one skill (worksheet exports, pool refills, simulations).
+
+    Every skill draws its numbers from rng, so passing random.Random(seed) gives the
+    same prompts and answers on every call. Without rng the global random module is used.
+    """
+    if n <= 0:
+        return []
+
+    return [generate_by_skill(skill_id, section, marks, difficulty, rng) for _ in range(n)]
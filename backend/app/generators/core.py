@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+import os
 import random
-import uuid
 from fractions import Fraction
 from typing import Any, Dict, List
 
 
 def _qid() -> str:
-    return f"q_{uuid.uuid4().hex[:10]}"
+    # Same shape as uuid4().hex[:10] (40 random bits), without building a UUID.
+    return f"q_{os.urandom(5).hex()}"
 
 
 def make_question(
@@ -33,15 +34,29 @@ def make_question(
     }
 
 
+# Inclusive (low, high) ranges for the numeric generators.
+ADD_SUB_A_RANGE = (1000, 9999)
+ADD_SUB_B_RANGE = (100, 9999)
+MULT_A_RANGE = (12, 99)
+MULT_B_RANGE = (2, 9)
+DIV_DIVISOR_RANGE = (2, 9)
+DIV_QUOTIENT_RANGE = (10, 120)
+RECT_LENGTH_RANGE = (4, 60)
+RECT_WIDTH_RANGE = (3, 45)
+
+
 # ----------------------------
 # Numbers
 # ----------------------------
 
-def gen_add_sub_4digit(section: str, marks: int, difficulty: int) -> Dict[str, Any]:
-    a = random.randint(1000, 9999)
-    b = random.randint(100, 9999)
+def gen_add_sub_4digit(
+    section: str, marks: int, difficulty: int, rng: random.Random | None = None
+) -> Dict[str, Any]:
+    r = rng or random
+    a = r.randint(*ADD_SUB_A_RANGE)
+    b = r.randint(*ADD_SUB_B_RANGE)
 
-    if random.random() < 0.5:
+    if r.random() < 0.5:
         ans = a + b
         return make_question(
             section, marks, difficulty,
@@ -65,9 +80,12 @@ def gen_add_sub_4digit(section: str, marks: int, difficulty: int) -> Dict[str, A
     )
 
 
-def gen_mult_2digit_by_1digit(section: str, marks: int, difficulty: int) -> Dict[str, Any]:
-    a = random.randint(12, 99)
-    b = random.randint(2, 9)
+def gen_mult_2digit_by_1digit(
+    section: str, marks: int, difficulty: int, rng: random.Random | None = None
+) -> Dict[str, Any]:
+    r = rng or random
+    a = r.randint(*MULT_A_RANGE)
+    b = r.randint(*MULT_B_RANGE)
     ans = a * b
     return make_question(
         section, marks, difficulty,
@@ -79,9 +97,12 @@ def gen_mult_2digit_by_1digit(section: str, marks: int, difficulty: int) -> Dict
     )
 
 
-def gen_div_exact(section: str, marks: int, difficulty: int) -> Dict[str, Any]:
-    d = random.randint(2, 9)
-    q = random.randint(10, 120)
+def gen_div_exact(
+    section: str, marks: int, difficulty: int, rng: random.Random | None = None
+) -> Dict[str, Any]:
+    r = rng or random
+    d = r.randint(*DIV_DIVISOR_RANGE)
+    q = r.randint(*DIV_QUOTIENT_RANGE)
     n = d * q
     return make_question(
         section, marks, difficulty,
@@ -97,24 +118,27 @@ def gen_div_exact(section: str, marks: int, difficulty: int) -> Dict[str, Any]:
 # Fractions
 # ----------------------------
 
-def gen_add_sub_fractions_unlike(section: str, marks: int, difficulty: int) -> Dict[str, Any]:
+def gen_add_sub_fractions_unlike(
+    section: str, marks: int, difficulty: int, rng: random.Random | None = None
+) -> Dict[str, Any]:
+    r = rng or random
     denoms = [2, 3, 4, 5, 6, 8, 10, 12]
     if difficulty >= 3:
         denoms += [9, 15]
 
     for _ in range(120):
-        d1 = random.choice(denoms)
-        d2 = random.choice(denoms)
+        d1 = r.choice(denoms)
+        d2 = r.choice(denoms)
         if d1 == d2:
             continue
 
-        n1 = random.randint(1, d1 - 1)
-        n2 = random.randint(1, d2 - 1)
+        n1 = r.randint(1, d1 - 1)
+        n2 = r.randint(1, d2 - 1)
 
         f1 = Fraction(n1, d1)
         f2 = Fraction(n2, d2)
 
-        op = random.choice(["+", "-"])
+        op = r.choice(["+", "-"])
 
         # ensure non-negative result for subtraction
         if op == "-" and f2 > f1:
@@ -147,11 +171,14 @@ def gen_add_sub_fractions_unlike(section: str, marks: int, difficulty: int) -> D
     )
 
 
-def gen_fraction_of_quantity(section: str, marks: int, difficulty: int) -> Dict[str, Any]:
-    d = random.choice([2, 3, 4, 5, 6, 8, 10, 12])
-    n = random.randint(1, d - 1)
+def gen_fraction_of_quantity(
+    section: str, marks: int, difficulty: int, rng: random.Random | None = None
+) -> Dict[str, Any]:
+    r = rng or random
+    d = r.choice([2, 3, 4, 5, 6, 8, 10, 12])
+    n = r.randint(1, d - 1)
 
-    qty = random.choice([d * k for k in range(5, 81)])  # divisible by d
+    qty = r.choice([d * k for k in range(5, 81)])  # divisible by d
     ans = (qty // d) * n
 
     return make_question(
@@ -168,9 +195,12 @@ def gen_fraction_of_quantity(section: str, marks: int, difficulty: int) -> Dict[
 # Percent
 # ----------------------------
 
-def gen_percent_of_quantity(section: str, marks: int, difficulty: int) -> Dict[str, Any]:
-    p = random.choice([10, 20, 25, 30, 40, 50, 60, 75])
-    qty = random.choice([20, 40, 60, 80, 100, 120, 150, 200, 240, 300, 400, 500])
+def gen_percent_of_quantity(
+    section: str, marks: int, difficulty: int, rng: random.Random | None = None
+) -> Dict[str, Any]:
+    r = rng or random
+    p = r.choice([10, 20, 25, 30, 40, 50, 60, 75])
+    qty = r.choice([20, 40, 60, 80, 100, 120, 150, 200, 240, 300, 400, 500])
     ans = int(qty * p / 100)
 
     return make_question(
@@ -187,9 +217,12 @@ def gen_percent_of_quantity(section: str, marks: int, difficulty: int) -> Dict[s
 # Measurement / Geometry
 # ----------------------------
 
-def gen_perimeter_rectangle(section: str, marks: int, difficulty: int) -> Dict[str, Any]:
-    L = random.randint(4, 60)
-    W = random.randint(3, 45)
+def gen_perimeter_rectangle(
+    section: str, marks: int, difficulty: int, rng: random.Random | None = None
+) -> Dict[str, Any]:
+    r = rng or random
+    L = r.randint(*RECT_LENGTH_RANGE)
+    W = r.randint(*RECT_WIDTH_RANGE)
     ans = 2 * (L + W)
 
     return make_question(
@@ -202,9 +235,12 @@ def gen_perimeter_rectangle(section: str, marks: int, difficulty: int) -> Dict[s
     )
 
 
-def gen_area_rectangle(section: str, marks: int, difficulty: int) -> Dict[str, Any]:
-    L = random.randint(4, 60)
-    W = random.randint(3, 45)
+def gen_area_rectangle(
+    section: str, marks: int, difficulty: int, rng: random.Random | None = None
+) -> Dict[str, Any]:
+    r = rng or random
+    L = r.randint(*RECT_LENGTH_RANGE)
+    W = r.randint(*RECT_WIDTH_RANGE)
     ans = L * W
 
     return make_question(
@@ -217,9 +253,12 @@ def gen_area_rectangle(section: str, marks: int, difficulty: int) -> Dict[str, A
     )
 
 
-def gen_triangle_angle(section: str, marks: int, difficulty: int) -> Dict[str, Any]:
-    a = random.randint(20, 120)
-    b = random.randint(20, 120)
+def gen_triangle_angle(
+    section: str, marks: int, difficulty: int, rng: random.Random | None = None
+) -> Dict[str, Any]:
+    r = rng or random
+    a = r.randint(20, 120)
+    b = r.randint(20, 120)
     if a + b >= 179:
         b = 180 - a - 1
     c = 180 - (a + b)
@@ -238,11 +277,14 @@ def gen_triangle_angle(section: str, marks: int, difficulty: int) -> Dict[str, A
 # Statistics (MVP text-based)
 # ----------------------------
 
-def gen_stat_read_table_basic(section: str, marks: int, difficulty: int) -> Dict[str, Any]:
+def gen_stat_read_table_basic(
+    section: str, marks: int, difficulty: int, rng: random.Random | None = None
+) -> Dict[str, Any]:
+    r = rng or random
     labels = ["A", "B", "C", "D"]
-    values = [random.randint(2, 9) for _ in labels]
+    values = [r.randint(2, 9) for _ in labels]
 
-    ask = random.choice(labels)
+    ask = r.choice(labels)
     ans = values[labels.index(ask)]
 
     prompt = (
@@ -262,11 +304,14 @@ def gen_stat_read_table_basic(section: str, marks: int, difficulty: int) -> Dict
     )
 
 
-def gen_stat_read_bar_chart_basic(section: str, marks: int, difficulty: int) -> Dict[str, Any]:
+def gen_stat_read_bar_chart_basic(
+    section: str, marks: int, difficulty: int, rng: random.Random | None = None
+) -> Dict[str, Any]:
+    r = rng or random
     cats = ["Mon", "Tue", "Wed", "Thu"]
-    vals = [random.randint(1, 9) for _ in cats]
+    vals = [r.randint(1, 9) for _ in cats]
 
-    ask = random.choice(cats)
+    ask = r.choice(cats)
     ans = vals[cats.index(ask)]
 
     bars = "\n".join([f"{c}: {'█'*v} ({v})" for c, v in zip(cats, vals)])
@@ -291,36 +336,38 @@ def gen_stat_read_bar_chart_basic(section: str, marks: int, difficulty: int) ->
 # Skill router
 # ----------------------------
 
-def generate_by_skill(skill_id: str, section: str, marks: int, difficulty: int) -> Dict[str, Any]:
+def generate_by_skill(
+    skill_id: str, section: str, marks: int, difficulty: int, rng: random.Random | None = None
+) -> Dict[str, Any]:
     # Numbers
     if skill_id == "std4_add_sub_4digit":
-        return gen_add_sub_4digit(section, marks, difficulty)
+        return gen_add_sub_4digit(section, marks, difficulty, rng)
     if skill_id == "std4_mult_2digit_by_1digit":
-        return gen_mult_2digit_by_1digit(section, marks, difficulty)
+        return gen_mult_2digit_by_1digit(section, marks, difficulty, rng)
     if skill_id == "std4_div_exact":
-        return gen_div_exact(section, marks, difficulty)
+        return gen_div_exact(section, marks, difficulty, rng)
 
     # Fractions / Percent
     if skill_id == "std5_add_sub_unlike_denoms":
-        return gen_add_sub_fractions_unlike(section, marks, difficulty)
+        return gen_add_sub_fractions_unlike(section, marks, difficulty, rng)
     if skill_id == "std5_fraction_of_quantity":
-        return gen_fraction_of_quantity(section, marks, difficulty)
+        return gen_fraction_of_quantity(section, marks, difficulty, rng)
     if skill_id == "std5_percent_of_quantity":
-        return gen_percent_of_quantity(section, marks, difficulty)
+        return gen_percent_of_quantity(section, marks, difficulty, rng)
 
     # Measurement / Geometry
     if skill_id == "std4_perimeter_rectangle":
-        return gen_perimeter_rectangle(section, marks, difficulty)
+        return gen_perimeter_rectangle(section, marks, difficulty, rng)
     if skill_id == "std4_area_rectangle":
-        return gen_area_rectangle(section, marks, difficulty)
+        return gen_area_rectangle(section, marks, difficulty, rng)
     if skill_id == "std5_triangle_angle":
-        return gen_triangle_angle(section, marks, difficulty)
+        return gen_triangle_angle(section, marks, difficulty, rng)
 
     # Statistics
     if skill_id == "stat_read_table_basic":
-        return gen_stat_read_table_basic(section, marks, difficulty)
+        return gen_stat_read_table_basic(section, marks, difficulty, rng)
     if skill_id == "stat_read_bar_chart_basic":
-        return gen_stat_read_bar_chart_basic(section, marks, difficulty)
+        return gen_stat_read_bar_chart_basic(section, marks, difficulty, rng)
 
     # Safe fallback (should be rare if skill IDs match)
     return make_question(
@@ -0,0 +1,41 @@
+"""
+Measure items/sec for generate_batch and for calling generate_by_skill per item.
+
+Run from backend/:
+    python -m scripts.bench_generate_batch
+"""
+from __future__ import annotations
+
+import random
+import time
+
+from app.generators.batch import generate_batch
+from app.generators.core import generate_by_skill
+
+SKILLS = [
+    "std4_add_sub_4digit",
+    "std4_mult_2digit_by_1digit",
+    "std4_div_exact",
+    "std4_perimeter_rectangle",
+    "std4_area_rectangle",
+]
+N = 20000
+
+
+def _rate(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return N / (time.perf_counter() - start)
+
+
+def main() -> None:
+    rng = random.Random(0)
+    print(f"{'skill':<30} {'per-item/s':>12} {'batch/s':>12}")
+    for skill_id in SKILLS:
+        single = _rate(lambda: [generate_by_skill(skill_id, "Section I", 1, 2) for _ in range(N)])
+        batch = _rate(lambda: generate_batch(skill_id, N, 2, rng))
+        print(f"{skill_id:<30} {single:>12,.0f} {batch:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
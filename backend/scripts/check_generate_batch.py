@@ -0,0 +1,115 @@
+"""
+Sanity-check generate_batch: seeded batches repeat, and numeric answers are right and in range.
+
+Run from backend/:
+    python -m scripts.check_generate_batch
+"""
+from __future__ import annotations
+
+import random
+import re
+
+from app.generators.batch import generate_batch
+from app.generators.core import (
+    ADD_SUB_A_RANGE,
+    ADD_SUB_B_RANGE,
+    DIV_DIVISOR_RANGE,
+    DIV_QUOTIENT_RANGE,
+    MULT_A_RANGE,
+    MULT_B_RANGE,
+    RECT_LENGTH_RANGE,
+    RECT_WIDTH_RANGE,
+)
+
+ALL_SKILLS = [
+    "std4_add_sub_4digit",
+    "std4_mult_2digit_by_1digit",
+    "std4_div_exact",
+    "std5_add_sub_unlike_denoms",
+    "std5_fraction_of_quantity",
+    "std5_percent_of_quantity",
+    "std4_perimeter_rectangle",
+    "std4_area_rectangle",
+    "std5_triangle_angle",
+    "stat_read_table_basic",
+    "stat_read_bar_chart_basic",
+]
+N = 5000
+
+
+def _in(x: int, bounds: tuple) -> bool:
+    return bounds[0] <= x <= bounds[1]
+
+
+def _check_add_sub(prompt: str, ans: int) -> None:
+    a, op, b = re.fullmatch(r"Calculate: (\d+) ([+-]) (\d+)", prompt).groups()
+    a, b = int(a), int(b)
+    if op == "+":
+        assert _in(a, ADD_SUB_A_RANGE) and _in(b, ADD_SUB_B_RANGE), prompt
+        assert ans == a + b, prompt
+    else:
+        # operands may have been swapped so the larger one comes first
+        assert a >= b and ans >= 0, prompt
+        assert (_in(a, ADD_SUB_A_RANGE) and _in(b, ADD_SUB_B_RANGE)) or (
+            _in(b, ADD_SUB_A_RANGE) and _in(a, ADD_SUB_B_RANGE)
+        ), prompt
+        assert ans == a - b, prompt
+
+
+def _check_mult(prompt: str, ans: int) -> None:
+    a, b = map(int, re.fullmatch(r"Calculate: (\d+) × (\d+)", prompt).groups())
+    assert _in(a, MULT_A_RANGE) and _in(b, MULT_B_RANGE), prompt
+    assert ans == a * b, prompt
+
+
+def _check_div(prompt: str, ans: int) -> None:
+    n, d = map(int, re.fullmatch(r"Calculate: (\d+) ÷ (\d+)", prompt).groups())
+    assert _in(d, DIV_DIVISOR_RANGE) and _in(ans, DIV_QUOTIENT_RANGE), prompt
+    assert n == d * ans, prompt
+
+
+def _rect(prompt: str) -> tuple:
+    L, W = map(int, re.search(r"length (\d+) cm and width (\d+) cm", prompt).groups())
+    assert _in(L, RECT_LENGTH_RANGE) and _in(W, RECT_WIDTH_RANGE), prompt
+    return L, W
+
+
+def _check_perimeter(prompt: str, ans: int) -> None:
+    L, W = _rect(prompt)
+    assert ans == 2 * (L + W), prompt
+
+
+def _check_area(prompt: str, ans: int) -> None:
+    L, W = _rect(prompt)
+    assert ans == L * W, prompt
+
+
+NUMERIC_CHECKS = {
+    "std4_add_sub_4digit": _check_add_sub,
+    "std4_mult_2digit_by_1digit": _check_mult,
+    "std4_div_exact": _check_div,
+    "std4_perimeter_rectangle": _check_perimeter,
+    "std4_area_rectangle": _check_area,
+}
+
+
+def main() -> None:
+    for skill_id in ALL_SKILLS:
+        first = generate_batch(skill_id, N, 3, random.Random(0))
+        second = generate_batch(skill_id, N, 3, random.Random(0))
+        assert len(first) == N
+        assert [q["prompt"] for q in first] == [q["prompt"] for q in second], skill_id
+        assert [q["correct_answer"] for q in first] == [q["correct_answer"] for q in second], skill_id
+        assert len({q["question_id"] for q in first}) == N, skill_id
+
+        check = NUMERIC_CHECKS.get(skill_id)
+        if check is not None:
+            for q in first:
+                check(q["prompt"], int(q["correct_answer"]["value"]))
+        print(f"ok  {skill_id}")
+
+    assert generate_batch("std4_div_exact", 0, 2) == []
+
+
+if __name__ == "__main__":
+    main()